@@ -746,7 +746,7 @@ def build_function_op_mapping(
 
     return FunctionOpMapping(
         op_code=op.name,
-        immediates=[
+        immediates=tuple(
             (
                 const_immediate_value[1].name
                 if const_immediate_value and const_immediate_value[0] == arg
@@ -756,11 +756,11 @@ def build_function_op_mapping(
                 )
             )
             for arg in op.immediate_args
-        ],
-        stack_inputs=[
+        ),
+        stack_inputs=tuple(
             StackArgMapping(
                 arg_name=arg_name_map[arg.name],
-                allowed_types=list(
+                allowed_types=tuple(
                     sub_types(
                         any_as if arg.stack_type == StackType.any and any_as else arg.stack_type,
                         covariant=True,
@@ -768,14 +768,14 @@ def build_function_op_mapping(
                 ),
             )
             for arg in op.stack_inputs
-        ],
-        stack_outputs=[
+        ),
+        stack_outputs=tuple(
             sub_types(
                 any_as if o.stack_type == StackType.any and any_as else o.stack_type,
                 covariant=False,
             )[0]
             for o in op.stack_outputs
-        ],
+        ),
     )
 
 
@@ -945,53 +945,323 @@ def build_wtype(wtype: wtypes.WType) -> str:
     raise ValueError("Unexpected wtype")
 
 
-def build_stack_arg_mapping(arg_mapping: StackArgMapping) -> Iterable[str]:
-    yield "StackArgMapping("
-    yield f'    arg_name="{arg_mapping.arg_name}",'
-    yield "    allowed_types=["
-    for allowed_type in arg_mapping.allowed_types:
-        if isinstance(allowed_type, wtypes.WType):
-            yield build_wtype(allowed_type)
+def build_tuple(sources: Sequence[str]) -> str:
+    if len(sources) == 1:
+        return f"({sources[0]},)"
+    return f"({', '.join(sources)})"
+
+
+def build_wtypes_tuple(wtypes_: Sequence[wtypes.WType]) -> str:
+    return build_tuple([build_wtype(wtype) for wtype in wtypes_])
+
+
+def _get_wtype_constant_name(wtype: wtypes.WType) -> str:
+    return build_wtype(wtype).removeprefix("wtypes.").removesuffix("_wtype").upper()
+
+
+def _add_constant(constants: dict[str, str], name: str, source: str) -> str:
+    if constants.setdefault(name, source) != source:
+        raise ValueError(f"Inconsistent constant: {name}")
+    return name
+
+
+def build_stack_arg_mapping(arg_mapping: StackArgMapping, constants: dict[str, str]) -> str:
+    """Returns the name of a shared module level constant for arg_mapping,
+    adding its definition to constants"""
+    type_names = map(_get_wtype_constant_name, arg_mapping.allowed_types)
+    return _add_constant(
+        constants,
+        name=f"_{arg_mapping.arg_name.upper()}_{'_OR_'.join(type_names)}",
+        source=(
+            f'StackArgMapping(arg_name="{arg_mapping.arg_name}",'
+            f" allowed_types={build_wtypes_tuple(arg_mapping.allowed_types)})"
+        ),
+    )
+
+
+def build_stack_outputs(stack_outputs: Sequence[wtypes.WType], constants: dict[str, str]) -> str:
+    """Returns the name of a shared module level constant for stack_outputs,
+    adding its definition to constants"""
+    type_names = map(_get_wtype_constant_name, stack_outputs)
+    return _add_constant(
+        constants,
+        name=f"_OUTPUTS_{'_'.join(type_names)}",
+        source=build_wtypes_tuple(stack_outputs),
+    )
+
+
+def build_immediate_arg_mapping(
+    arg_mapping: ImmediateArgMapping, constants: dict[str, str]
+) -> str:
+    """Returns the name of a shared module level constant for arg_mapping,
+    adding its definition to constants"""
+    literal_type_name = arg_mapping.literal_type.__name__
+    return _add_constant(
+        constants,
+        name=f"_IMMEDIATE_{arg_mapping.arg_name.upper()}_{literal_type_name.upper()}",
+        source=(
+            f'ImmediateArgMapping(arg_name="{arg_mapping.arg_name}",'
+            f" literal_type={literal_type_name})"
+        ),
+    )
+
+
+@attrs.frozen
+class FieldPosition:
+    immediate_index: int
+    """Index of the field immediate"""
+    input_index: int | None = None
+    """Index of the stack input whose allowed types are determined by the field"""
+    output_index: int | None = None
+    """Index of the stack output whose type is determined by the field"""
+
+    @property
+    def type_param(self) -> str:
+        """Name of the template parameter that receives the field dependent type(s)"""
+        return "allowed_types" if self.input_index is not None else "wtype"
+
+
+@attrs.frozen
+class AnyPosition:
+    input_indexes: tuple[int, ...]
+    """Indexes of the stack inputs whose type replaces any"""
+    output_indexes: tuple[int, ...]
+    """Indexes of the stack outputs whose type replaces any"""
+
+
+@attrs.frozen
+class FieldTable:
+    class_name: str
+    template_name: str
+    type_param: str
+    rows: tuple[str, ...]
+    """Source of each (name, field, type) row"""
+
+
+def build_function_op_mapping_source(
+    op_mapping: FunctionOpMapping,
+    constants: dict[str, str],
+    field_position: FieldPosition | None = None,
+    any_position: AnyPosition | None = None,
+) -> Iterable[str]:
+    yield "FunctionOpMapping("
+    yield f'    op_code="{op_mapping.op_code}",'
+    immediates = list[str]()
+    for index, immediate in enumerate(op_mapping.immediates):
+        if field_position and index == field_position.immediate_index:
+            immediates.append("field")
+        elif isinstance(immediate, str):
+            immediates.append(f'"{immediate}"')
+        else:
+            immediates.append(build_immediate_arg_mapping(immediate, constants))
+    if immediates:
+        yield f"    immediates={build_tuple(immediates)},"
+    stack_inputs = list[str]()
+    for index, stack_input in enumerate(op_mapping.stack_inputs):
+        if field_position and index == field_position.input_index:
+            stack_inputs.append(
+                f'StackArgMapping(arg_name="{stack_input.arg_name}", allowed_types=allowed_types)'
+            )
+        elif any_position and index in any_position.input_indexes:
+            stack_inputs.append(
+                f'StackArgMapping(arg_name="{stack_input.arg_name}", allowed_types=(wtype,))'
+            )
         else:
-            yield allowed_type.__name__
-        yield ","
-    yield "    ],"
-    yield ")"
+            stack_inputs.append(build_stack_arg_mapping(stack_input, constants))
+    if stack_inputs:
+        yield f"    stack_inputs={build_tuple(stack_inputs)},"
+    wtype_output_indexes = set(any_position.output_indexes if any_position else ())
+    if field_position and field_position.output_index is not None:
+        wtype_output_indexes.add(field_position.output_index)
+    if wtype_output_indexes:
+        stack_outputs = [
+            "wtype" if index in wtype_output_indexes else build_wtype(stack_output)
+            for index, stack_output in enumerate(op_mapping.stack_outputs)
+        ]
+        yield f"    stack_outputs={build_tuple(stack_outputs)},"
+    elif op_mapping.stack_outputs:
+        yield f"    stack_outputs={build_stack_outputs(op_mapping.stack_outputs, constants)},"
+    yield "),"
 
 
-def build_immediate_arg_mapping(arg_mapping: ImmediateArgMapping) -> Iterable[str]:
-    yield "ImmediateArgMapping("
-    yield f'    arg_name="{arg_mapping.arg_name}",'
-    yield f"    literal_type={arg_mapping.literal_type.__name__},"
-    yield ")"
+def _literal_arg_count(op_mapping: FunctionOpMapping) -> int:
+    return len(op_mapping.literal_arg_names)
 
 
-def build_op_specification_body(name_suffix: str, function: FunctionDef) -> Iterable[str]:
-    yield f'    "algopy.{STUB_NAMESPACE}.{name_suffix}": ['
+def check_op_mappings(name: str, function: FunctionDef) -> None:
+    # overload selection relies on there being at most one op mapping without literal args
+    if sum(not op_mapping.literal_arg_names for op_mapping in function.op_mappings) > 1:
+        raise ValueError(f"Ambiguous op mappings for {name}")
+
+
+def build_op_specification_body(
+    name_suffix: str, function: FunctionDef, constants: dict[str, str]
+) -> Iterable[str]:
+    yield f'    "algopy.{STUB_NAMESPACE}.{name_suffix}": ('
+    for op_mapping in sorted(function.op_mappings, key=_literal_arg_count, reverse=True):
+        yield from build_function_op_mapping_source(op_mapping, constants)
+    yield "    ),"
+
+
+def get_field_positions(
+    lang_spec: LanguageSpec, function: FunctionDef
+) -> list[FieldPosition] | None:
+    """If function is a field accessor, i.e. each of its op mappings has a constant immediate
+    that determines the type of a stack input or output, return the position of that immediate
+    and stack value for each op mapping"""
+    field_positions = list[FieldPosition]()
     for op_mapping in function.op_mappings:
-        yield "FunctionOpMapping("
-        yield f'    op_code="{op_mapping.op_code}",'
-        yield f"    is_property={op_mapping.is_property},"
-        yield "    immediates=["
-        for immediate in op_mapping.immediates:
-            if isinstance(immediate, str):
-                yield f'        "{immediate}",'
-            else:
-                yield from build_immediate_arg_mapping(immediate)
-                yield ","
-        yield "    ],"
-        yield "    stack_inputs=["
-        for stack_input in op_mapping.stack_inputs:
-            yield from build_stack_arg_mapping(stack_input)
-            yield ","
-        yield "    ],"
-        yield "    stack_outputs=["
-        for stack_output in op_mapping.stack_outputs:
-            yield build_wtype(stack_output)
-            yield ","
-        yield "    ],"
-        yield "),"
-    yield "    ],"
+        op = lang_spec.ops[op_mapping.op_code]
+        immediate = get_overriding_immediate(op)
+        if immediate is None:
+            return None
+        field_positions.append(
+            FieldPosition(
+                immediate_index=op.immediate_args.index(immediate),
+                input_index=immediate.modifies_stack_input,
+                output_index=immediate.modifies_stack_output,
+            )
+        )
+    # all op mappings must agree on how the field is passed to the template
+    if len({field_position.type_param for field_position in field_positions}) != 1:
+        return None
+    return field_positions
+
+
+def build_field_template(
+    template_name: str,
+    function: FunctionDef,
+    field_positions: Sequence[FieldPosition],
+    constants: dict[str, str],
+) -> Iterable[str]:
+    match field_positions[0].type_param:
+        case "wtype":
+            type_param = "wtype: wtypes.WType"
+        case _:
+            type_param = "allowed_types: tuple[wtypes.WType, ...]"
+    yield f"def {template_name}(field: str, {type_param}) -> tuple[FunctionOpMapping, ...]:"
+    yield "    return ("
+    for op_mapping, field_position in sorted(
+        zip(function.op_mappings, field_positions, strict=True),
+        key=lambda pair: _literal_arg_count(pair[0]),
+        reverse=True,
+    ):
+        yield from build_function_op_mapping_source(op_mapping, constants, field_position)
+    yield "    )"
+    yield ""
+
+
+def _get_field_type_source(op_mapping: FunctionOpMapping, field_position: FieldPosition) -> str:
+    if field_position.input_index is not None:
+        allowed_types = op_mapping.stack_inputs[field_position.input_index].allowed_types
+        return build_wtypes_tuple(allowed_types)
+    else:
+        assert field_position.output_index is not None
+        return build_wtype(op_mapping.stack_outputs[field_position.output_index])
+
+
+def build_field_row(function: FunctionDef, field_positions: Sequence[FieldPosition]) -> str:
+    (row,) = {
+        (
+            op_mapping.immediates[field_position.immediate_index],
+            _get_field_type_source(op_mapping, field_position),
+        )
+        for op_mapping, field_position in zip(function.op_mappings, field_positions, strict=True)
+    }
+    field, field_type = row
+    return f'        ("{function.name}", "{field}", {field_type}),'
+
+
+def get_any_positions(
+    bytes_function: FunctionDef, uint64_function: FunctionDef
+) -> list[AnyPosition] | None:
+    """If both functions map to the same ops, with any replaced by bytes and uint64 respectively,
+    return the positions of the replaced stack values for each op mapping"""
+    if len(bytes_function.op_mappings) != len(uint64_function.op_mappings):
+        return None
+    any_positions = list[AnyPosition]()
+    for bytes_mapping, uint64_mapping in zip(
+        bytes_function.op_mappings, uint64_function.op_mappings, strict=True
+    ):
+        if (
+            bytes_mapping.op_code != uint64_mapping.op_code
+            or bytes_mapping.immediates != uint64_mapping.immediates
+            or len(bytes_mapping.stack_inputs) != len(uint64_mapping.stack_inputs)
+            or len(bytes_mapping.stack_outputs) != len(uint64_mapping.stack_outputs)
+        ):
+            return None
+        input_indexes = list[int]()
+        for index, (bytes_input, uint64_input) in enumerate(
+            zip(bytes_mapping.stack_inputs, uint64_mapping.stack_inputs, strict=True)
+        ):
+            if bytes_input == uint64_input:
+                continue
+            if bytes_input != StackArgMapping(
+                arg_name=uint64_input.arg_name, allowed_types=(wtypes.bytes_wtype,)
+            ) or uint64_input.allowed_types != (wtypes.uint64_wtype,):
+                return None
+            input_indexes.append(index)
+        output_indexes = list[int]()
+        for index, (bytes_output, uint64_output) in enumerate(
+            zip(bytes_mapping.stack_outputs, uint64_mapping.stack_outputs, strict=True)
+        ):
+            if bytes_output == uint64_output:
+                continue
+            if (bytes_output, uint64_output) != (wtypes.bytes_wtype, wtypes.uint64_wtype):
+                return None
+            output_indexes.append(index)
+        any_positions.append(
+            AnyPosition(input_indexes=tuple(input_indexes), output_indexes=tuple(output_indexes))
+        )
+    return any_positions
+
+
+def build_any_template(
+    template_name: str,
+    function: FunctionDef,
+    any_positions: Sequence[AnyPosition],
+    constants: dict[str, str],
+) -> Iterable[str]:
+    yield f"def {template_name}(wtype: wtypes.WType) -> tuple[FunctionOpMapping, ...]:"
+    yield "    return ("
+    for op_mapping, any_position in sorted(
+        zip(function.op_mappings, any_positions, strict=True),
+        key=lambda pair: _literal_arg_count(pair[0]),
+        reverse=True,
+    ):
+        yield from build_function_op_mapping_source(
+            op_mapping, constants, any_position=any_position
+        )
+    yield "    )"
+    yield ""
+
+
+def build_any_variant_calls(
+    functions: Sequence[FunctionDef],
+    templates: dict[str, list[str]],
+    constants: dict[str, str],
+) -> dict[str, str]:
+    """Functions that only differ by the type replacing any (e.g. gload_bytes and gload_uint64)
+    are generated from a shared template, returns the template call for each such function"""
+    functions_by_name = {function.name: function for function in functions}
+    calls = dict[str, str]()
+    for bytes_function in functions:
+        base_name = bytes_function.name.removesuffix("_bytes")
+        uint64_function = functions_by_name.get(f"{base_name}_uint64")
+        if base_name == bytes_function.name or uint64_function is None:
+            continue
+        any_positions = get_any_positions(bytes_function, uint64_function)
+        if any_positions is None:
+            continue
+        template_name = f"_{bytes_function.op_mappings[0].op_code}"
+        template = list(
+            build_any_template(template_name, bytes_function, any_positions, constants)
+        )
+        if templates.setdefault(template_name, template) != template:
+            raise ValueError(f"Inconsistent template: {template_name}")
+        calls[bytes_function.name] = f"{template_name}(wtypes.bytes_wtype)"
+        calls[uint64_function.name] = f"{template_name}(wtypes.uint64_wtype)"
+    return calls
 
 
 def build_awst_data(
@@ -1000,30 +1270,131 @@ def build_awst_data(
     function_ops: list[FunctionDef],
     class_ops: list[ClassDef],
 ) -> Iterable[str]:
+    # shared instances of repeated values, name -> source
+    constants = dict[str, str]()
+    templates = dict[str, list[str]]()
+    mapper = list[str | FieldTable]()
+    for function_op in function_ops:
+        check_op_mappings(function_op.name, function_op)
+    for class_op in class_ops:
+        for method in class_op.methods:
+            check_op_mappings(f"{class_op.name}.{method.name}", method)
+
+    any_variant_calls = build_any_variant_calls(function_ops, templates, constants)
+    for function_op in function_ops:
+        if function_op.name in any_variant_calls:
+            mapper.append(
+                f'    "algopy.{STUB_NAMESPACE}.{function_op.name}":'
+                f" {any_variant_calls[function_op.name]},"
+            )
+        else:
+            mapper.extend(build_op_specification_body(function_op.name, function_op, constants))
+
+    for class_op in class_ops:
+        # field accessors that share the same op mapping are generated from a table
+        field_rows = dict[str, list[str]]()
+        type_params = dict[str, str]()
+        any_variant_calls = build_any_variant_calls(class_op.methods, templates, constants)
+        for method in class_op.methods:
+            if method.name in any_variant_calls:
+                mapper.append(
+                    f'    "algopy.{STUB_NAMESPACE}.{class_op.name}.{method.name}":'
+                    f" {any_variant_calls[method.name]},"
+                )
+                continue
+            field_positions = get_field_positions(lang_spec, method)
+            if field_positions is None:
+                mapper.extend(
+                    build_op_specification_body(
+                        f"{class_op.name}.{method.name}", method, constants
+                    )
+                )
+                continue
+            template_name = f"_{method.op_mappings[0].op_code}"
+            type_params.setdefault(template_name, field_positions[0].type_param)
+            template = list(
+                build_field_template(template_name, method, field_positions, constants)
+            )
+            if templates.setdefault(template_name, template) != template:
+                raise ValueError(f"Inconsistent template: {template_name}")
+            field_rows.setdefault(template_name, []).append(
+                build_field_row(method, field_positions)
+            )
+        for template_name, rows in field_rows.items():
+            mapper.append(
+                FieldTable(
+                    class_name=class_op.name,
+                    template_name=template_name,
+                    type_param=type_params[template_name],
+                    rows=tuple(rows),
+                )
+            )
+
+    # identical field tables (e.g. the txn fields of Txn, GTxn, ITxn and GITxn) are shared,
+    # and named after the shortest template using them
+    table_users = dict[tuple[str, ...], list[str]]()
+    for entry in mapper:
+        if isinstance(entry, FieldTable):
+            table_users.setdefault(entry.rows, []).append(entry.template_name)
+    shared_tables = {
+        rows: f"{min(template_names, key=lambda n: (len(n), n)).lstrip('_')}_fields"
+        for rows, template_names in table_users.items()
+        if len(template_names) > 1
+    }
+
+    yield "import functools"
+    yield "import typing"
+    yield "from collections.abc import Mapping, Sequence"
+    yield ""
+    yield "from immutabledict import immutabledict"
+    yield ""
     yield "from puya.awst import wtypes"
     yield (
         "from puya.awst_build.intrinsic_models import"
         " FunctionOpMapping, ImmediateArgMapping, StackArgMapping"
     )
     yield ""
-    yield "ENUM_CLASSES = {"
+    yield "ENUM_CLASSES: typing.Final[Mapping[str, Mapping[str, str]]] = immutabledict({"
     for enum_name in enums:
-        yield f'    "algopy.{STUB_NAMESPACE}.{get_python_enum_class(enum_name)}": {{'
+        yield (
+            f'    "algopy.{STUB_NAMESPACE}.{get_python_enum_class(enum_name)}": immutabledict({{'
+        )
         for enum_value in lang_spec.arg_enums[enum_name]:
             # enum names currently match enum immediate values
             yield f'    "{enum_value.name}": "{enum_value.name}",'
-        yield "     },"
-    yield "}"
+        yield "     }),"
+    yield "})"
     yield ""
-    yield "STUB_TO_AST_MAPPER = {"
-    for function_op in function_ops:
-        yield from build_op_specification_body(function_op.name, function_op)
-
-    for class_op in class_ops:
-        for method in class_op.methods:
-            yield from build_op_specification_body(f"{class_op.name}.{method.name}", method)
-
-    yield "}"
+    for name, source in sorted(constants.items()):
+        yield f"{name} = {source}"
+    yield ""
+    for template in templates.values():
+        yield from template
+    yield "@functools.cache"
+    yield "def get_stub_to_ast_mapper() -> Mapping[str, Sequence[FunctionOpMapping]]:"
+    yield '    """Op mappings of each stub, ordered by number of literal arguments descending"""'
+    for table_rows, table_name in shared_tables.items():
+        yield f"    {table_name} = ("
+        yield from table_rows
+        yield "    )"
+    yield "    return immutabledict({"
+    for entry in mapper:
+        if not isinstance(entry, FieldTable):
+            yield entry
+            continue
+        yield (
+            f'    **{{f"algopy.{STUB_NAMESPACE}.{entry.class_name}.{{name}}":'
+            f" {entry.template_name}(field, {entry.type_param})"
+        )
+        try:
+            table_name = shared_tables[entry.rows]
+        except KeyError:
+            yield f"    for name, field, {entry.type_param} in ("
+            yield from entry.rows
+            yield "    )},"
+        else:
+            yield f"    for name, field, {entry.type_param} in {table_name}}},"
+    yield "    })"
 
 
 def output_stub(
@@ -11,7 +11,7 @@ from puya.awst.nodes import Expression, IntrinsicCall, Literal, MethodConstant
 from puya.awst_build.constants import ARC4_SIGNATURE_ALIAS
 from puya.awst_build.eb.base import ExpressionBuilder, IntermediateExpressionBuilder
 from puya.awst_build.eb.var_factory import var_expression
-from puya.awst_build.intrinsic_data import ENUM_CLASSES, STUB_TO_AST_MAPPER
+from puya.awst_build.intrinsic_data import ENUM_CLASSES, get_stub_to_ast_mapper
 from puya.awst_build.intrinsic_models import FunctionOpMapping, ImmediateArgMapping
 from puya.awst_build.utils import convert_literal, get_arg_mapping
 from puya.errors import InternalError
@@ -146,15 +146,19 @@ def _get_arg_mapping_funcdef(
 
 
 def _best_op_mapping(
-    op_mappings: list[FunctionOpMapping], args: dict[str, Expression | Literal]
+    op_mappings: Sequence[FunctionOpMapping], args: dict[str, Expression | Literal]
 ) -> FunctionOpMapping:
     """Find op mapping that matches as many arguments to immediate args as possible"""
     literal_arg_names = {arg_name for arg_name, arg in args.items() if isinstance(arg, Literal)}
-    for op_mapping in sorted(op_mappings, key=lambda om: len(om.literal_arg_names), reverse=True):
+    # op mappings are ordered by number of literal args descending, so without any
+    # literal args the only possible match is the last one
+    if not literal_arg_names:
+        return op_mappings[-1]
+    for op_mapping in op_mappings:
         if literal_arg_names.issuperset(op_mapping.literal_arg_names):
             return op_mapping
-    # fall back to first, let argument mapping handle logging errors
-    return op_mappings[0]
+    # fall back to the op with the fewest literal args, let argument mapping handle logging errors
+    return op_mappings[-1]
 
 
 def _return_types_to_wtype(types: Sequence[wtypes.WType]) -> wtypes.WType:
@@ -169,7 +173,7 @@ def _return_types_to_wtype(types: Sequence[wtypes.WType]) -> wtypes.WType:
 def _map_call(
     callee: str, node_location: SourceLocation, args: dict[str, Expression | Literal]
 ) -> IntrinsicCall:
-    ast_mapper = STUB_TO_AST_MAPPER.get(callee)
+    ast_mapper = get_stub_to_ast_mapper().get(callee)
     if not ast_mapper:
         raise InternalError(f"Un-mapped intrinsic call for {callee}", node_location)
     if len(ast_mapper) == 1:
@@ -1,4 +1,3 @@
-from collections.abc import Sequence
 from functools import cached_property
 
 import attrs
@@ -9,20 +8,20 @@ from puya.awst import wtypes
 # referenced by both scripts/generate_stubs.py and src/puya/awst_build/eb/intrinsics.py
 
 
-@attrs.frozen
+@attrs.frozen(weakref_slot=False)
 class StackArgMapping:
     arg_name: str
     """Name of algopy argument to obtain value from"""
-    allowed_types: Sequence[wtypes.WType] = attrs.field()
+    allowed_types: tuple[wtypes.WType, ...] = attrs.field()
     """Valid types for this argument, in descending priority for literal conversions"""
 
     @allowed_types.validator
-    def check(self, _attribute: object, value: Sequence[wtypes.WType]) -> None:
+    def check(self, _attribute: object, value: tuple[wtypes.WType, ...]) -> None:
         if wtypes.biguint_wtype in value and wtypes.uint64_wtype in value:
             raise ValueError("overlap in integral types")
 
 
-@attrs.frozen
+@attrs.frozen(weakref_slot=False)
 class ImmediateArgMapping:
     arg_name: str
     """Name of algopy argument to obtain value from"""
@@ -30,18 +29,16 @@ class ImmediateArgMapping:
     """Literal type for the argument"""
 
 
-@attrs.frozen
+@attrs.frozen(weakref_slot=False)
 class FunctionOpMapping:
     op_code: str
     """TEAL op code for this mapping"""
-    immediates: Sequence[str | ImmediateArgMapping] = attrs.field(factory=tuple)
+    immediates: tuple[str | ImmediateArgMapping, ...] = ()
     """A list of constant values or references to an algopy argument to include in immediate"""
-    stack_inputs: Sequence[StackArgMapping] = attrs.field(factory=tuple)
+    stack_inputs: tuple[StackArgMapping, ...] = ()
     """References to an algopy argument"""
-    stack_outputs: Sequence[wtypes.WType] = attrs.field(factory=tuple)
+    stack_outputs: tuple[wtypes.WType, ...] = ()
     """Types output by TEAL op"""
-    is_property: bool = False
-    """Is this function represented as a property"""
 
     @cached_property
     def literal_arg_names(self) -> set[str]: